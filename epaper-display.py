@@ -24,11 +24,16 @@ import os
 import sys
 import time
 import json
+import random
+import hashlib
+import heapq
 import signal
 import logging
 from datetime import datetime
+from math import ceil, isfinite
 from threading import Thread, Event
-from typing import Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from typing import Optional, Dict, Any, List, Tuple
 
 # Try to import display libraries (will fail on non-Pi systems)
 try:
@@ -39,7 +44,7 @@ except ImportError:
     print("⚠ PIL not available - install with: pip3 install Pillow")
 
 try:
-    from waveshare_epd import epd4in26
+    from waveshare_epd import epd4in26, epdconfig
     EPAPER_AVAILABLE = True
 except ImportError:
     EPAPER_AVAILABLE = False
@@ -52,6 +57,25 @@ except ImportError:
     REQUESTS_AVAILABLE = False
     print("⚠ requests not available - install with: pip3 install requests")
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("⚠ numpy not available - install with: sudo apt-get install python3-numpy")
+
+# Numeric hot loops (numba-compiled when it's installed, Python/numpy otherwise)
+from kernels import NUMBA_AVAILABLE, atkinson_kernel, closest_index, haversine
+
+# Optional: faster decoding of the API responses (OpenSky states can run to tens of KB)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from ujson import loads as json_loads
+    except ImportError:
+        json_loads = json.loads
+
 # ═══════════════════════════════════════════════════════════════
 # Configuration
 # ═══════════════════════════════════════════════════════════════
@@ -63,11 +87,47 @@ DISPLAY_HEIGHT = 480
 # Server configuration
 SERVER_URL = os.environ.get('SERVER_URL', 'http://localhost:3000')
 
+
+def _env_seconds(name: str, default: float, minimum: float) -> float:
+    """Read an interval in seconds from the environment, no shorter than `minimum`."""
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = None
+    if value is None or not isfinite(value):
+        print(f"⚠ {name}={raw!r} is not a number of seconds - using {default}")
+        return default
+    if value < minimum:
+        print(f"⚠ {name}={raw} is below {minimum}s - using {minimum}")
+        return minimum
+    return value
+
+
 # Timing configuration
 CLOCK_UPDATE_INTERVAL = 60      # Update clock every 60 seconds (on the minute)
-FLIGHT_CHECK_INTERVAL = 15      # Check for flights every 15 seconds
+FLIGHT_POLL_FLOOR = 5           # Shortest flight poll interval FLIGHT_POLL_MIN may set
+FLIGHT_CHECK_INTERVAL = _env_seconds('FLIGHT_POLL_MIN', 15, FLIGHT_POLL_FLOOR)  # Check for flights every 15 seconds
+# ...but each poll that finds nothing waits one interval longer, up to this
+FLIGHT_POLL_MAX = _env_seconds('FLIGHT_POLL_MAX', max(120, FLIGHT_CHECK_INTERVAL), FLIGHT_CHECK_INTERVAL)
 WEATHER_UPDATE_INTERVAL = 600   # Update weather every 10 minutes
 FULL_REFRESH_INTERVAL = 21600   # Full refresh every 6 hours (prevents ghosting)
+# ...or sooner, once partial refreshes have flipped this many pixels in total
+# (ghosting builds up with the number of transitions, not with time)
+EINK_PARTIAL_ERASURE_LIMIT = DISPLAY_WIDTH * DISPLAY_HEIGHT * 2
+
+# Scheduled tasks and how often they repeat ('clock' runs on every minute boundary)
+TASK_INTERVALS = {
+    'clock': CLOCK_UPDATE_INTERVAL,
+    'flights': FLIGHT_CHECK_INTERVAL,
+    'weather': WEATHER_UPDATE_INTERVAL,
+}
+CLOCK_TICK_MARGIN = 0.01  # Seconds past the minute boundary to wake for the clock
+PUSH_RETRY_DELAY = 0.5  # Re-check this soon when a display update waits on an in-flight push
+ERROR_BACKOFF_MIN = 1      # Loop error backoff: doubles per consecutive failure...
+ERROR_BACKOFF_MAX = 60     # ...up to this, with ±0.2 s jitter
 
 # Font paths (adjust for your system)
 FONT_PATHS = [
@@ -77,6 +137,17 @@ FONT_PATHS = [
     'C:/Windows/Fonts/arial.ttf',  # Windows fallback for testing
 ]
 
+# Every font size the renderer draws with (loaded up front)
+FONT_SIZES = (12, 16, 18, 20, 22, 24, 28, 36, 120)
+CLOCK_CHARS = '0123456789:'  # Pre-rendered as tiles for the big clock
+TEXT_WIDTH_CACHE_MAX = 256   # Measured strings kept for centering (dates, track/artist names)
+
+# On-disk cache (dithered album art survives restarts)
+CACHE_DIR = os.environ.get('VECTORCLOCK_CACHE_DIR', os.path.expanduser('~/.cache/vectorclock'))
+ART_CACHE_DIR = os.path.join(CACHE_DIR, 'art')
+ART_CACHE_MAX_FILES = 100
+LAST_REFRESH_PATH = os.path.join(CACHE_DIR, 'last_refresh')  # Time of the panel's last full refresh, saved at shutdown
+
 # Logging setup
 logging.basicConfig(
     level=logging.INFO,
@@ -85,6 +156,18 @@ logging.basicConfig(
 )
 log = logging.getLogger('epaper')
 
+# Shared HTTP session - keeps connections to the server (and album art CDN) alive
+if REQUESTS_AVAILABLE:
+    from requests.adapters import HTTPAdapter
+    SESSION = requests.Session()
+    SESSION.headers['Accept-Encoding'] = 'gzip'
+    _adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    SESSION.mount('http://', _adapter)
+    SESSION.mount('https://', _adapter)
+
+SETTINGS_CACHE_TTL = 60  # Re-fetch album art settings at most once a minute
+CONNECT_TIMEOUT = 2      # Seconds to establish a connection (read timeouts are per call)
+
 # ═══════════════════════════════════════════════════════════════
 # Font Manager
 # ═══════════════════════════════════════════════════════════════
@@ -93,9 +176,15 @@ class FontManager:
     """Manages fonts with fallback support."""
     
     def __init__(self):
-        self.fonts: Dict[str, ImageFont.FreeTypeFont] = {}
+        self.fonts: Dict[int, ImageFont.FreeTypeFont] = {}
+        self.glyphs: Dict[Tuple[str, int], Dict[str, Tuple[Image.Image, float]]] = {}
+        self.widths: Dict[Tuple[str, int], int] = {}
         self.base_path = self._find_font()
         
+        # Pre-warm so the first render doesn't load each size from the SD card
+        for size in FONT_SIZES:
+            self.get(size)
+        
     def _find_font(self) -> Optional[str]:
         """Find an available font on the system."""
         for path in FONT_PATHS:
@@ -104,17 +193,53 @@ class FontManager:
         return None
     
     def get(self, size: int, bold: bool = True) -> ImageFont.FreeTypeFont:
-        """Get a font at the specified size."""
-        key = f"{size}_{bold}"
-        if key not in self.fonts:
+        """Get a font at the specified size (a single bold face is used for all text)."""
+        font = self.fonts.get(size)
+        if font is None:
             if self.base_path:
                 try:
-                    self.fonts[key] = ImageFont.truetype(self.base_path, size)
+                    font = ImageFont.truetype(self.base_path, size)
                 except Exception:
-                    self.fonts[key] = ImageFont.load_default()
+                    font = ImageFont.load_default()
             else:
-                self.fonts[key] = ImageFont.load_default()
-        return self.fonts[key]
+                font = ImageFont.load_default()
+            self.fonts[size] = font
+        return font
+    
+    def text_width(self, text: str, size: int) -> int:
+        """Ink width of `text` at `size` (textbbox width), measured once per string."""
+        key = (text, size)
+        width = self.widths.get(key)
+        if width is None:
+            left, _, right, _ = self.get(size).getbbox(text, mode='1')  # As textbbox on a '1' image
+            width = right - left
+            if len(self.widths) >= TEXT_WIDTH_CACHE_MAX:
+                self.widths.clear()
+            self.widths[key] = width
+        return width
+    
+    def render_glyphs(self, chars: str, size: int) -> Dict[str, Tuple[Image.Image, float]]:
+        """
+        Rasterize a set of characters once, as 1-bit ink masks plus advance widths,
+        for composing text by paste instead of FreeType. The characters are drawn
+        as one line and then sliced, so every tile shares the same baseline
+        (upright glyphs whose ink stays within their advance, e.g. digits).
+        """
+        key = (chars, size)
+        glyphs = self.glyphs.get(key)
+        if glyphs is None:
+            font = self.get(size)
+            _, _, right, bottom = font.getbbox(chars)
+            strip = Image.new('1', (right, bottom), 0)
+            ImageDraw.Draw(strip).text((0, 0), chars, font=font, fill=255)
+            glyphs = {}
+            pen = 0.0
+            for ch in chars:
+                advance = font.getlength(ch)
+                glyphs[ch] = (strip.crop((int(pen), 0, int(pen + advance), bottom)), advance)
+                pen += advance
+            self.glyphs[key] = glyphs
+        return glyphs
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -129,6 +254,40 @@ BAYER_MATRIX_4x4 = [
     [15, 7, 13,  5]
 ]
 
+
+def _bayer_matrix(n: int):
+    """Build an n x n Bayer index matrix (n a power of two) by recursive expansion."""
+    if n == 1:
+        return [[0]]
+    half = _bayer_matrix(n // 2)
+    return ([[4 * v for v in row] + [4 * v + 2 for v in row] for row in half] +
+            [[4 * v + 3 for v in row] + [4 * v + 1 for v in row] for row in half])
+
+
+BAYER_MATRIX_8x8 = _bayer_matrix(8)
+BAYER_MATRIX_16x16 = _bayer_matrix(16)
+
+# Bayer matrices normalized to 0-255 thresholds (computed once), keyed by size
+BAYER_THRESHOLDS = {
+    len(m): [[((v + 1) / (len(m) ** 2 + 1)) * 255 for v in row] for row in m]
+    for m in (BAYER_MATRIX_4x4, BAYER_MATRIX_8x8, BAYER_MATRIX_16x16)
+}
+DEFAULT_BAYER_SIZE = 8
+
+
+def _numpy_simd_features() -> list:
+    """SIMD extensions numpy's ufuncs dispatch to on this CPU (e.g. NEON/ASIMD on the Pi)."""
+    try:
+        try:
+            from numpy._core._multiarray_umath import __cpu_features__
+        except ImportError:
+            from numpy.core._multiarray_umath import __cpu_features__
+    except ImportError:
+        return []
+    wanted = ('NEON', 'ASIMD', 'SSE2', 'AVX2')
+    return [name for name in wanted if __cpu_features__.get(name)]
+
+
 class AlbumArtManager:
     """
     Manages album art fetching, caching, and dithering for e-ink display.
@@ -143,31 +302,69 @@ class AlbumArtManager:
         self.cached_url: Optional[str] = None
         self.cached_art: Optional[Image.Image] = None
         self.cached_dithered: Dict[str, Image.Image] = {}  # algorithm -> dithered image
+        self.cached_gray: Dict[int, Image.Image] = {}  # size -> resized grayscale art
         
         # Display settings (fetched from server)
         self.display_mode = 'thumbnail'  # 'thumbnail' or 'music'
         self.dither_algorithm = 'floyd'  # 'floyd', 'atkinson', 'ordered'
         self.show_album_art = True
+        self.bayer_size = DEFAULT_BAYER_SIZE  # 4, 8 or 16 (ordered dithering)
+        self.settings_fetched_at = 0.0
         
         # Thumbnail size for "now playing" bar
         self.thumbnail_size = 50
         # Large size for "music mode"
         self.music_mode_size = 180
+        
+        # Ordered dithering thresholds, tiled per (bayer_size, height, width)
+        self._bayer_tiles: Dict[Tuple[int, int, int], Any] = {}
+        if NUMPY_AVAILABLE:
+            # Integer thresholds keep the compare uint8-vs-uint8, which numpy runs on
+            # 16-lane SIMD; pixel > t and pixel > floor(t) are equivalent for integer pixels
+            self._bayer = {n: np.array(t, dtype=np.float32).astype(np.uint8)
+                           for n, t in BAYER_THRESHOLDS.items()}
+            simd = _numpy_simd_features()
+            if simd:
+                log.debug(f"numpy SIMD: {', '.join(simd)}")
+            else:
+                log.warning("numpy has no SIMD dispatch - install python3-numpy from apt "
+                            "or the piwheels build for NEON-accelerated dithering")
+        
+        log.info("Dither backends: floyd=pillow, "
+                 f"atkinson={'numba' if NUMBA_AVAILABLE and NUMPY_AVAILABLE else 'python'}, "
+                 f"ordered={'numpy' if NUMPY_AVAILABLE else 'python'}")
     
-    def fetch_settings(self, server_url: str) -> None:
-        """Fetch album art display settings from server."""
-        if not REQUESTS_AVAILABLE:
-            return
+    def settings_due(self) -> bool:
+        """True once the settings are older than SETTINGS_CACHE_TTL (or were never fetched)."""
+        return REQUESTS_AVAILABLE and time.time() - self.settings_fetched_at >= SETTINGS_CACHE_TTL
+    
+    def fetch_settings(self, server_url: str) -> Optional[Dict]:
+        """
+        Fetch album art display settings from the server (safe on a worker thread:
+        nothing is changed here - apply_settings() applies the result).
+        """
         try:
-            response = requests.get(f"{server_url}/api/config/spotify-display", timeout=5)
+            response = SESSION.get(f"{server_url}/api/config/spotify-display",
+                                   timeout=(CONNECT_TIMEOUT, 5))
             if response.status_code == 200:
-                data = response.json()
-                self.display_mode = data.get('displayMode', 'thumbnail')
-                self.dither_algorithm = data.get('ditherAlgorithm', 'floyd')
-                self.show_album_art = data.get('showAlbumArt', True)
-                log.info(f"Album art settings: mode={self.display_mode}, dither={self.dither_algorithm}")
+                return json_loads(response.content)
         except Exception as e:
             log.debug(f"Could not fetch album art settings: {e}")
+        return None
+    
+    def apply_settings(self, data: Optional[Dict]) -> None:
+        """Apply settings from fetch_settings() (on the thread that renders)."""
+        if not data:
+            return
+        previous = (self.display_mode, self.dither_algorithm, self.show_album_art, self.bayer_size)
+        self.display_mode = data.get('displayMode', 'thumbnail')
+        self.dither_algorithm = data.get('ditherAlgorithm', 'floyd')
+        self.show_album_art = data.get('showAlbumArt', True)
+        bayer_size = data.get('bayerSize', DEFAULT_BAYER_SIZE)
+        self.bayer_size = bayer_size if bayer_size in BAYER_THRESHOLDS else DEFAULT_BAYER_SIZE
+        self.settings_fetched_at = time.time()
+        if (self.display_mode, self.dither_algorithm, self.show_album_art, self.bayer_size) != previous:
+            log.info(f"Album art settings: mode={self.display_mode}, dither={self.dither_algorithm}, bayer={self.bayer_size}")
     
     def get_dithered_art(self, url: str, size: int) -> Optional[Image.Image]:
         """
@@ -188,41 +385,61 @@ class AlbumArtManager:
         
         # Check cache
         cache_key = f"{self.dither_algorithm}_{size}"
+        if self.dither_algorithm == 'ordered':
+            cache_key += f"_{self.bayer_size}"
         if url == self.cached_url and cache_key in self.cached_dithered:
             log.debug(f"Album art: Using cached {cache_key}")
             return self.cached_dithered[cache_key]
         
+        if url != self.cached_url:
+            # New track - drop everything cached for the previous URL
+            self.cached_url = url
+            self.cached_art = None
+            self.cached_dithered = {}  # Clear dither cache
+            self.cached_gray = {}
+        
+        # Check disk cache (survives restarts)
+        disk_path = self._disk_cache_path(url, cache_key)
+        dithered = self._load_from_disk(disk_path)
+        if dithered:
+            self.cached_dithered[cache_key] = dithered
+            log.info(f"Album art loaded from disk cache ({cache_key})")
+            return dithered
+        
         try:
-            # Fetch new album art if URL changed
-            if url != self.cached_url:
+            # Fetch album art if not loaded for this URL yet
+            if self.cached_art is None:
                 log.info(f"Fetching album art: {url[:60]}...")
-                response = requests.get(url, timeout=10)
+                response = SESSION.get(url, timeout=(CONNECT_TIMEOUT, 10))
                 if response.status_code != 200:
                     log.warning(f"Album art fetch failed: HTTP {response.status_code}")
                     return None
                 
                 from io import BytesIO
-                self.cached_art = Image.open(BytesIO(response.content))
-                self.cached_url = url
-                self.cached_dithered = {}  # Clear dither cache
-                log.info(f"Album art loaded: {self.cached_art.size} {self.cached_art.mode}")
+                art = Image.open(BytesIO(response.content))
+                log.info(f"Album art loaded: {art.size} {art.mode}")
+                # Grayscale up front - resizing one channel is ~3x cheaper than RGB
+                self.cached_art = art.convert('L')
             
-            if not self.cached_art:
-                log.debug("Album art: No cached art available")
-                return None
-            
-            # Resize to target size
-            art = self.cached_art.copy()
-            art = art.resize((size, size), Image.Resampling.LANCZOS)
-            
-            # Convert to grayscale
-            art = art.convert('L')
+            # Resize to target size (once per size, so switching dither
+            # algorithms skips the LANCZOS pass)
+            art = self.cached_gray.get(size)
+            if art is None:
+                source = self.cached_art
+                # Cheap box-filter shrink to ~2x target first (e.g. Spotify's 640px art),
+                # so LANCZOS only filters a small image
+                factor = min(source.size) // (size * 2)
+                if factor > 1:
+                    source = source.reduce(factor)
+                art = source.resize((size, size), Image.Resampling.LANCZOS)
+                self.cached_gray[size] = art
             
             # Apply dithering
             dithered = self._apply_dithering(art, self.dither_algorithm)
             
             # Cache the result
             self.cached_dithered[cache_key] = dithered
+            self._save_to_disk(disk_path, dithered)
             log.info(f"Album art dithered ({self.dither_algorithm}): {size}x{size}")
             
             return dithered
@@ -233,8 +450,43 @@ class AlbumArtManager:
             log.debug(traceback.format_exc())
             return None
     
+    def _disk_cache_path(self, url: str, cache_key: str) -> str:
+        """Disk cache file for a URL + dither variant."""
+        url_hash = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(ART_CACHE_DIR, f"{url_hash}_{cache_key}.png")
+    
+    def _load_from_disk(self, path: str) -> Optional[Image.Image]:
+        """Load a dithered image from the disk cache, if present."""
+        if not os.path.exists(path):
+            return None
+        try:
+            image = Image.open(path)
+            image.load()
+            os.utime(path)  # Mark as recently used
+            return image if image.mode == '1' else image.convert('1', dither=Image.Dither.NONE)
+        except Exception as e:
+            log.debug(f"Album art disk cache read failed: {e}")
+            return None
+    
+    def _save_to_disk(self, path: str, image: Image.Image) -> None:
+        """Save a dithered image to the disk cache, evicting the least recently used files."""
+        try:
+            os.makedirs(ART_CACHE_DIR, exist_ok=True)
+            image.save(path, optimize=True)
+            
+            files = [os.path.join(ART_CACHE_DIR, f) for f in os.listdir(ART_CACHE_DIR)]
+            if len(files) > ART_CACHE_MAX_FILES:
+                files.sort(key=os.path.getmtime)
+                for old in files[:len(files) - ART_CACHE_MAX_FILES]:
+                    os.remove(old)
+        except Exception as e:
+            log.debug(f"Album art disk cache write failed: {e}")
+    
     def _apply_dithering(self, image: Image.Image, algorithm: str) -> Image.Image:
-        """Apply the specified dithering algorithm to a grayscale image."""
+        """
+        Apply the specified dithering algorithm to a grayscale image.
+        The input is left untouched (it is shared via cached_gray).
+        """
         if algorithm == 'atkinson':
             return self._dither_atkinson(image)
         elif algorithm == 'ordered':
@@ -242,39 +494,29 @@ class AlbumArtManager:
         else:  # floyd (default)
             return self._dither_floyd_steinberg(image)
     
+    def _run_error_diffusion(self, image: Image.Image, kernel) -> Image.Image:
+        """Run a JIT-compiled error-diffusion kernel over a grayscale image."""
+        arr = np.array(image, dtype=np.int16)
+        kernel(arr)
+        # Already pure 0/255 - a plain threshold, no second dither pass
+        return Image.fromarray(arr.astype(np.uint8)).convert('1', dither=Image.Dither.NONE)
+    
     def _dither_floyd_steinberg(self, image: Image.Image) -> Image.Image:
         """
-        Floyd-Steinberg dithering.
+        Floyd-Steinberg dithering (Pillow's native implementation).
         Distributes error to neighboring pixels for smooth gradients.
         """
-        img = image.copy()
-        pixels = img.load()
-        width, height = img.size
-        
-        for y in range(height):
-            for x in range(width):
-                old_pixel = pixels[x, y]
-                new_pixel = 255 if old_pixel > 127 else 0
-                pixels[x, y] = new_pixel
-                error = old_pixel - new_pixel
-                
-                # Distribute error to neighbors
-                if x + 1 < width:
-                    pixels[x + 1, y] = max(0, min(255, int(pixels[x + 1, y] + error * 7 / 16)))
-                if y + 1 < height:
-                    if x > 0:
-                        pixels[x - 1, y + 1] = max(0, min(255, int(pixels[x - 1, y + 1] + error * 3 / 16)))
-                    pixels[x, y + 1] = max(0, min(255, int(pixels[x, y + 1] + error * 5 / 16)))
-                    if x + 1 < width:
-                        pixels[x + 1, y + 1] = max(0, min(255, int(pixels[x + 1, y + 1] + error * 1 / 16)))
-        
-        return img.convert('1')
+        return image.convert('1', dither=Image.Dither.FLOYDSTEINBERG)
     
     def _dither_atkinson(self, image: Image.Image) -> Image.Image:
         """
         Atkinson dithering (Bill Atkinson, Apple).
         Higher contrast, more stylized - only distributes 6/8 of error.
         """
+        if NUMBA_AVAILABLE and NUMPY_AVAILABLE:
+            return self._run_error_diffusion(image, atkinson_kernel)
+        
+        # Working buffer - the input is the cached grayscale and must not be touched
         img = image.copy()
         pixels = img.load()
         width, height = img.size
@@ -300,26 +542,41 @@ class AlbumArtManager:
                 if y + 2 < height:
                     pixels[x, y + 2] = max(0, min(255, pixels[x, y + 2] + error))
         
-        return img.convert('1')
+        return img.convert('1', dither=Image.Dither.NONE)
     
     def _dither_ordered(self, image: Image.Image) -> Image.Image:
         """
-        Ordered dithering using 4x4 Bayer matrix.
+        Ordered dithering using a 4x4, 8x8 or 16x16 Bayer matrix.
         Creates regular geometric patterns (screentone aesthetic).
         """
-        img = image.copy()
-        pixels = img.load()
-        width, height = img.size
-        
-        # Normalize Bayer matrix to 0-255 range
-        threshold_map = [[((BAYER_MATRIX_4x4[y][x] + 1) / 17) * 255 for x in range(4)] for y in range(4)]
+        n = self.bayer_size
+        if NUMPY_AVAILABLE:
+            arr = np.asarray(image, dtype=np.uint8)
+            h, w = arr.shape
+            tmap = self._bayer_tiles.get((n, h, w))
+            if tmap is None:
+                tmap = np.tile(self._bayer[n], ((h + n - 1) // n, (w + n - 1) // n))[:h, :w]
+                self._bayer_tiles[(n, h, w)] = tmap
+            # Pack the comparison straight into 1-bit rows (MSB first, 1 = white)
+            bits = np.packbits(arr > tmap, axis=1)
+            return Image.frombytes('1', (w, h), bits.tobytes())
+        
+        # Read from the (shared, cached) grayscale and write straight into a
+        # 1-bit result - no working copy and no final convert pass
+        pixels = image.load()
+        width, height = image.size
+        result = Image.new('1', image.size, 0)
+        out = result.load()
+        
+        thresholds = BAYER_THRESHOLDS[n]
         
         for y in range(height):
+            threshold_row = thresholds[y % n]
             for x in range(width):
-                threshold = threshold_map[y % 4][x % 4]
-                pixels[x, y] = 255 if pixels[x, y] > threshold else 0
+                threshold = threshold_row[x % n]
+                out[x, y] = 255 if pixels[x, y] > threshold else 0
         
-        return img.convert('1')
+        return result
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -334,16 +591,32 @@ class DataFetcher:
         self.location = {'latitude': -33.9117, 'longitude': 151.1552, 'name': 'Sydney'}
         self.last_flight = None
         self.weather = None
-        
-    def fetch_json(self, endpoint: str, timeout: int = 10) -> Optional[Dict]:
-        """Fetch JSON from an API endpoint."""
+        # Requests release the GIL while waiting on the socket, so threads overlap the round trips
+        self.pool = ThreadPoolExecutor(max_workers=5, thread_name_prefix='fetch')
+        self.pending: Dict[str, Future] = {}  # Fetches still running past a batch's timeout
+        self._etags: Dict[Tuple, Tuple[str, Any]] = {}  # (endpoint, params) -> (ETag, body) for conditional GETs
+        self._empty_polls = 0   # Consecutive flight polls that found no aircraft
+        self._flight_skips = 0  # Batches left to run without a flight poll
+        
+    def fetch_json(self, endpoint: str, timeout: int = 10,
+                   params: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
+        """Fetch JSON from an API endpoint (with an optional query string from `params`)."""
         if not REQUESTS_AVAILABLE:
             return None
         try:
             url = f"{self.server_url}{endpoint}"
-            response = requests.get(url, timeout=timeout)
+            key = (endpoint, tuple(params.items()) if params else ())
+            cached = self._etags.get(key)
+            headers = {'If-None-Match': cached[0]} if cached else None
+            response = SESSION.get(url, params=params, timeout=(CONNECT_TIMEOUT, timeout), headers=headers)
+            if response.status_code == 304 and cached:
+                return cached[1]  # Unchanged - no body sent
             if response.status_code == 200:
-                return response.json()
+                data = json_loads(response.content)
+                etag = response.headers.get('ETag')
+                if etag:
+                    self._etags[key] = (etag, data)
+                return data
         except Exception as e:
             log.warning(f"API error {endpoint}: {e}")
         return None
@@ -369,41 +642,100 @@ class DataFetcher:
         
         # Create bounding box (roughly 50km)
         delta = 0.5
-        endpoint = f"/api/opensky?lamin={lat-delta}&lamax={lat+delta}&lomin={lon-delta}&lomax={lon+delta}"
+        bbox = {'lamin': lat - delta, 'lamax': lat + delta, 'lomin': lon - delta, 'lomax': lon + delta}
         
-        data = self.fetch_json(endpoint)
+        data = self.fetch_json('/api/opensky', params=bbox)
         if data and 'states' in data and data['states']:
-            # Find closest flight
-            closest = None
-            min_dist = float('inf')
+            # state[5] = longitude, state[6] = latitude
+            candidates = [state for state in data['states']
+                          if len(state) >= 7 and state[5] and state[6]]
+            if not candidates:
+                return None
             
-            for state in data['states']:
-                if len(state) >= 7 and state[5] and state[6]:
-                    # state[5] = longitude, state[6] = latitude
-                    dist = self._haversine(lat, lon, state[6], state[5])
-                    if dist < min_dist:
-                        min_dist = dist
-                        closest = {
-                            'icao24': state[0],
-                            'callsign': (state[1] or '').strip(),
-                            'latitude': state[6],
-                            'longitude': state[5],
-                            'altitude': state[7] if len(state) > 7 else None,
-                            'velocity': state[9] if len(state) > 9 else None,
-                            'distance': round(dist, 1),
-                            # ADSB.lol enriched data
-                            'typecode': state[17] if len(state) > 17 else None,
-                            'registration': state[18] if len(state) > 18 else None,
-                        }
+            # Find closest flight
+            if NUMPY_AVAILABLE:
+                lats = np.array([state[6] for state in candidates], dtype=np.float64)
+                lons = np.array([state[5] for state in candidates], dtype=np.float64)
+                idx, min_dist = closest_index(lats, lons, lat, lon)
+            else:
+                dists = [haversine(lat, lon, state[6], state[5]) for state in candidates]
+                idx = min(range(len(dists)), key=dists.__getitem__)
+                min_dist = dists[idx]
             
-            return closest
+            state = candidates[idx]
+            return {
+                'icao24': state[0],
+                'callsign': (state[1] or '').strip(),
+                'latitude': state[6],
+                'longitude': state[5],
+                'altitude': state[7] if len(state) > 7 else None,
+                'velocity': state[9] if len(state) > 9 else None,
+                'distance': round(min_dist, 1),
+                # ADSB.lol enriched data
+                'typecode': state[17] if len(state) > 17 else None,
+                'registration': state[18] if len(state) > 18 else None,
+            }
         return None
     
+    def fetch_all(self, flights: bool = True, weather: bool = True,
+                  timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Fetch flights, special alerts, now playing and weather concurrently.
+        Returns a dict keyed by 'flight', 'special_alerts', 'now_playing', 'weather'
+        holding whatever finished within `timeout` seconds (None waits for all).
+        Slower fetches keep running and are returned by a later call instead
+        of being requested again.
+        """
+        names = []
+        if flights:
+            # Alerts and now playing keep the batch cadence; in an empty sky the
+            # flight poll itself sits out a growing number of batches
+            names += ['special_alerts', 'now_playing']
+            if self._flight_skips > 0:
+                self._flight_skips -= 1
+            else:
+                names.append('flight')
+        if weather:
+            names.append('weather')
+        self.prefetch(*names)
+        
+        wait(list(self.pending.values()), timeout=timeout)
+        
+        results = {}
+        for name, future in list(self.pending.items()):
+            if future.done():
+                del self.pending[name]
+                results[name] = future.result()
+        if 'flight' in results:
+            self._note_flight_poll(results['flight'])
+        return results
+    
+    def _note_flight_poll(self, flight: Optional[Dict]):
+        """Back flight polling off by one interval per empty poll (up to FLIGHT_POLL_MAX)."""
+        if flight:
+            self._empty_polls = 0
+        else:
+            self._empty_polls += 1
+        max_skips = max(0, int(FLIGHT_POLL_MAX // FLIGHT_CHECK_INTERVAL) - 1)
+        self._flight_skips = min(self._empty_polls, max_skips)
+    
+    def prefetch(self, *names: str):
+        """Start fetches in the background; fetch_all() collects them rather than re-requesting."""
+        jobs = {
+            'flight': self.get_flights,
+            'special_alerts': self.get_special_alerts,
+            'now_playing': self.get_now_playing,
+            'weather': self.get_weather,
+        }
+        for name in names:
+            if name not in self.pending:
+                self.pending[name] = self.pool.submit(jobs[name])
+    
     def get_special_alerts(self) -> Dict:
         """Fetch special aircraft alerts (military, emergency, VIP)."""
         loc = self.location
-        endpoint = f"/api/special-alerts?lat={loc['latitude']}&lon={loc['longitude']}&range=100"
-        return self.fetch_json(endpoint) or {'military': [], 'emergency': [], 'vip': []}
+        params = {'lat': loc['latitude'], 'lon': loc['longitude'], 'range': 100}
+        return self.fetch_json('/api/special-alerts', params=params) or {'military': [], 'emergency': [], 'vip': []}
     
     def get_now_playing(self) -> Optional[Dict]:
         """Fetch Spotify now playing track."""
@@ -411,20 +743,154 @@ class DataFetcher:
         if data and data.get('playing'):
             return data
         return None
-    
-    def _haversine(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calculate distance between two points in km."""
-        from math import radians, cos, sin, sqrt, atan2
-        R = 6371  # Earth radius in km
-        
-        lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
+
+
+# ═══════════════════════════════════════════════════════════════
+# E-Paper Driver (bulk SPI writes)
+# ═══════════════════════════════════════════════════════════════
+
+SPI_CHUNK_SIZE = 4096  # spidev writebytes() per-call limit
+SPI_SPEED_HZ = 32000000  # The stock epdconfig opens the bus at 4 MHz
+CMD_DATA_ENTRY_MODE = 0x11  # Data byte: bit0 X+, bit1 Y+, bit2 Y-first
+CMD_WRITE_RAM_BW = 0x24
+
+# Windowed partial writes address controller RAM directly, so they stay off
+# until --probe-windows has shown them landing in place on the panel
+PARTIAL_WINDOWS = os.environ.get('EPD_PARTIAL_WINDOWS') == '1'
+
+if EPAPER_AVAILABLE:
+    class FastEPD(epd4in26.EPD):
+        """
+        Waveshare 4.26" driver that sends data buffers in bulk.
+        Frame data goes out in a single DC=1/CS=0 transaction instead of
+        one SPI call (and two GPIO toggles) per byte.
+        """
         
-        a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-        c = 2 * atan2(sqrt(a), sqrt(1-a))
+        def init(self, *args, **kwargs):
+            """
+            Initialise the panel, then raise the SPI clock for the frame transfers.
+            The data entry mode and full-frame window/cursor init() programs are
+            recorded, so windowed writes can follow them and full writes restore them.
+            """
+            self._last_command = None
+            self._in_init = True
+            try:
+                result = super().init(*args, **kwargs)
+            finally:
+                self._in_init = False
+            spi = getattr(getattr(epdconfig, 'implementation', None), 'SPI', None)
+            if spi is not None:
+                try:
+                    spi.max_speed_hz = SPI_SPEED_HZ
+                except Exception as e:
+                    log.debug(f"Could not set SPI speed: {e}")
+            if not hasattr(self, 'native_layout'):
+                self.native_layout = self._probe_layout()
+            return result
+        
+        def _probe_layout(self) -> bool:
+            """
+            Check once that the stock getbuffer() is the raw byte layout of a '1'
+            image - what the packbits path, the renderer's framebuffer and its
+            windowed RAM writes all assume.
+            """
+            probe = Image.new('1', (self.width, self.height), 255)
+            ImageDraw.Draw(probe).line((0, 0, self.width - 1, self.height - 1), fill=0)
+            if bytes(super().getbuffer(probe)) == probe.tobytes():
+                return True
+            log.warning("Driver frame layout differs from Pillow's - using its getbuffer()")
+            return False
         
-        return R * c
+        def send_command(self, command):
+            """Send a command byte, noting it so init()'s data bytes can be matched to it."""
+            self._last_command = command
+            super().send_command(command)
+        
+        def SetWindow(self, *args):
+            """Set the RAM window (recorded as the full-frame window during init())."""
+            if getattr(self, '_in_init', False):
+                self.frame_window = args
+            super().SetWindow(*args)
+        
+        def SetCursor(self, *args):
+            """Set the RAM address counter (recorded as the frame origin during init())."""
+            if getattr(self, '_in_init', False):
+                self.frame_cursor = args
+            super().SetCursor(*args)
+        
+        @property
+        def windows_addressable(self) -> bool:
+            """
+            True if init() set a mode windowed writes can follow: X-first with X
+            incrementing from 0, over a window of all the panel's rows.
+            """
+            mode = getattr(self, 'data_entry_mode', None)
+            window = getattr(self, 'frame_window', None)
+            cursor = getattr(self, 'frame_cursor', None)
+            return (mode is not None and mode & 0x05 == 0x01 and window is not None and
+                    cursor is not None and window[0] == cursor[0] == 0 and
+                    window[2] == self.width - 1 and abs(window[1] - window[3]) + 1 == self.height)
+        
+        def set_frame_window(self):
+            """Restore the full-frame RAM window and cursor init() programmed."""
+            if getattr(self, 'frame_window', None) is not None:
+                super().SetWindow(*self.frame_window)
+            if getattr(self, 'frame_cursor', None) is not None:
+                super().SetCursor(*self.frame_cursor)
+        
+        def write_window(self, box: Tuple[int, int, int, int], data: bytes):
+            """
+            Write a byte-aligned box of image rows into B/W RAM. A row lands where
+            a full frame puts it: counted from init()'s cursor in its Y direction,
+            wrapping at the window edge (a box crossing the wrap goes in two parts).
+            """
+            x0, y0, x1, y1 = box
+            step = 1 if self.data_entry_mode & 0x02 else -1
+            lo, hi = sorted(self.frame_window[1::2])
+            row_bytes = (x1 - x0) // 8
+            y = y0
+            while y < y1:
+                start = lo + (self.frame_cursor[1] - lo + step * y) % self.height
+                rows = min((hi - start if step > 0 else start - lo) + 1, y1 - y)
+                super().SetWindow(x0, start, x1 - 1, start + step * (rows - 1))
+                super().SetCursor(x0, start)
+                self.send_command(CMD_WRITE_RAM_BW)
+                self.send_data2(data[(y - y0) * row_bytes:(y - y0 + rows) * row_bytes])
+                y += rows
+        
+        def send_data2(self, data):
+            """Send a whole data buffer in one SPI transaction."""
+            epdconfig.digital_write(self.dc_pin, 1)
+            epdconfig.digital_write(self.cs_pin, 0)
+            if hasattr(epdconfig, 'spi_writebyte2'):
+                epdconfig.spi_writebyte2(data)
+            else:
+                # Older epdconfig without writebytes2 - stay under spidev's limit
+                for i in range(0, len(data), SPI_CHUNK_SIZE):
+                    epdconfig.spi_writebyte(list(data[i:i + SPI_CHUNK_SIZE]))
+            epdconfig.digital_write(self.cs_pin, 1)
+        
+        def send_data(self, data):
+            """Send a single byte, or route a whole buffer through send_data2."""
+            if isinstance(data, int):
+                if getattr(self, '_in_init', False) and self._last_command == CMD_DATA_ENTRY_MODE:
+                    self.data_entry_mode = data
+                super().send_data(data)
+            else:
+                self.send_data2(data)
+        
+        def getbuffer(self, image):
+            """
+            Pack a frame with numpy.packbits (8 px/byte, MSB first, 1 = white)
+            rather than the stock per-pixel loop. Rotated or odd-sized images
+            still go through the original.
+            """
+            if (NUMPY_AVAILABLE and getattr(self, 'native_layout', True)
+                    and image.size == (self.width, self.height)):
+                if image.mode != '1':
+                    image = image.convert('1')
+                return bytearray(np.packbits(np.asarray(image), axis=1))
+            return super().getbuffer(image)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -450,8 +916,8 @@ REGIONS = {
     'clock': Region(200, 160, 400, 160),      # Center - large clock
     'date': Region(250, 320, 300, 40),        # Below clock - date
     'weather': Region(0, 0, 250, 100),        # Top left - weather
-    'flight': Region(0, 365, 800, 55),        # Bottom - flight info (adjusted for art)
-    'now_playing': Region(0, 420, 800, 60),   # Very bottom - now playing with album art
+    'flight': Region(0, 360, 800, 70),        # Bottom - flight info, detail line included
+    'now_playing': Region(0, 430, 800, 50),   # Very bottom - now playing with album art
     'status': Region(550, 0, 250, 60),        # Top right - status
     'music_mode': Region(0, 100, 800, 300),   # Center area for music mode
     'clock_mini': Region(700, 10, 100, 40),   # Top right - mini clock for music mode
@@ -473,9 +939,53 @@ class DisplayRenderer:
         self.image = None
         self.draw = None
         self.last_full_refresh = 0
-        self.current_minute = -1
+        self._clock_state = None    # (hour, minute) on screen
+        self._date_state = None     # Date on screen
         self.current_flight = None
         self.music_mode_active = False
+        self._content_state = None  # Fingerprint of the flight/status/now-playing strip on screen
+        self._templates: Dict[str, Image.Image] = {}  # Pre-rendered fixed content, pasted instead of redrawn
+        
+        # The clock is composed from pre-rendered digit tiles (no glyph rasterizing per minute)
+        self.clock_glyphs = self.fonts.render_glyphs(CLOCK_CHARS, 120)
+        # Per-character ink top/bottom, so a time is centred on its own ink
+        # height exactly as textbbox() of the whole string would place it
+        clock_font = self.fonts.get(120)
+        self._clock_extents = {ch: clock_font.getbbox(ch, mode='1')[1::2] for ch in CLOCK_CHARS}
+        
+        # Windowed partial refresh needs a RAM entry mode FastEPD can follow and
+        # EPD_PARTIAL_WINDOWS=1 (after --probe-windows checked it on the panel);
+        # the first partial after a full refresh goes through display_Partial()
+        # so the driver can switch the panel into partial mode.
+        self._partial_windows = False
+        self._partial_primed = False
+        self._supports_partial = False  # Driver has display_Partial() (checked once at init)
+        
+        # Refreshes block while the panel redraws (~1.5 s full, a few hundred ms
+        # partial), so they run on a background thread; drawing into self.image
+        # meanwhile is safe because the thread only holds packed copies.
+        self._push_thread: Optional[Thread] = None
+        self._panel_stale = False  # A push failed - the panel no longer matches the shadow
+        
+        # Two preallocated full-frame SPI buffers, used alternately so packing the
+        # next frame never overwrites the one the push thread is still sending
+        self._spi_bufs = [bytearray(DISPLAY_WIDTH // 8 * DISPLAY_HEIGHT) for _ in range(2)]
+        self._spi_index = 0
+        
+        # The frame packed to panel bytes once per push (Pillow keeps '1' images
+        # at a byte per pixel, so this can't share memory with self.image);
+        # the frame hash, the shadow and every window write slice this copy
+        self._fb = bytearray(DISPLAY_WIDTH // 8 * DISPLAY_HEIGHT)
+        self._native_layout = True  # Panel bytes match that layout (probed by FastEPD.init)
+        
+        # Hash of the frame last pushed (or saved as the preview), so unchanged
+        # frames skip the SPI transfer / PNG encode entirely
+        self._last_img_hash: Optional[int] = None
+        
+        # What the controller RAM holds, in panel byte layout (the raw bytes of a
+        # '1' image); windows whose bytes match it are not resent
+        self._shadow: Optional[bytearray] = None
+        self._erased_pixels = 0  # Pixels flipped by partial refreshes since the last full one
         
         self._init_display()
     
@@ -483,9 +993,21 @@ class DisplayRenderer:
         """Initialize the e-paper display."""
         if EPAPER_AVAILABLE:
             try:
-                self.epd = epd4in26.EPD()
+                self.epd = FastEPD()
                 self.epd.init()
-                self.epd.Clear()
+                if self._last_refresh_recent():
+                    # The panel still holds a recent, cleanly refreshed frame; the
+                    # startup render's full refresh replaces it without a clear cycle
+                    log.info("Last full refresh is recent - skipping startup clear")
+                else:
+                    self.epd.Clear()
+                self._native_layout = getattr(self.epd, 'native_layout', True)
+                self._supports_partial = hasattr(self.epd, 'display_Partial')
+                self._partial_windows = (
+                    PARTIAL_WINDOWS and self._native_layout and self._supports_partial and
+                    self.epd.windows_addressable and hasattr(self.epd, 'TurnOnDisplay_Part'))
+                if PARTIAL_WINDOWS and not self._partial_windows:
+                    log.warning("Windowed partial refresh unsupported by this driver - sending whole frames")
                 log.info("✓ E-Paper display initialized")
             except Exception as e:
                 log.error(f"Display init failed: {e}")
@@ -498,49 +1020,318 @@ class DisplayRenderer:
             self.image = Image.new('1', (DISPLAY_WIDTH, DISPLAY_HEIGHT), 255)
             self.draw = ImageDraw.Draw(self.image)
     
+    def _last_refresh_recent(self) -> bool:
+        """True if the stamp saved at the last shutdown puts the panel's last full refresh within the interval."""
+        try:
+            with open(LAST_REFRESH_PATH) as f:
+                refreshed_at = float(f.read())
+        except (OSError, ValueError):
+            return False
+        return 0 <= time.time() - refreshed_at <= FULL_REFRESH_INTERVAL
+    
+    def _save_refresh_stamp(self):
+        """
+        Save the wall-clock time of the last full refresh for the next start.
+        Nothing is saved once a push has failed: what the panel shows is unknown,
+        so the next start must clear it.
+        """
+        try:
+            if self._panel_stale or not self.last_full_refresh:
+                os.remove(LAST_REFRESH_PATH)
+                return
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            refreshed_at = time.time() - (time.monotonic() - self.last_full_refresh)
+            tmp_path = LAST_REFRESH_PATH + '.tmp'
+            with open(tmp_path, 'w') as f:
+                f.write(f"{refreshed_at:.0f}")
+            os.replace(tmp_path, LAST_REFRESH_PATH)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            log.debug(f"Could not save last refresh time: {e}")
+    
+    def _sync_framebuffer(self):
+        """
+        Pack the 1-bit frame into self._fb as panel bytes (8 px/byte, MSB first,
+        1 = white) - the layout epd.getbuffer() produces, and the raw layout of a '1' image.
+        """
+        if NUMPY_AVAILABLE:
+            view = np.frombuffer(self._fb, dtype=np.uint8).reshape(DISPLAY_HEIGHT, DISPLAY_WIDTH // 8)
+            view[...] = np.packbits(np.asarray(self.image), axis=1)
+        else:
+            self._fb[:] = self.image.tobytes()
+    
+    def _pack_frame(self, box: Optional[Tuple[int, int, int, int]] = None) -> bytearray:
+        """
+        The packed frame (or a byte-aligned box of it) from the framebuffer;
+        _frame_hash() must have synced it first. Whole frames are copied into
+        the next SPI buffer so the push thread keeps its own.
+        """
+        if box is None:
+            if not self._native_layout or self.image.size != (self.epd.width, self.epd.height):
+                return self.epd.getbuffer(self.image)
+            self._spi_index ^= 1
+            buf = self._spi_bufs[self._spi_index]
+            buf[:] = self._fb
+            return buf
+        return bytearray(self._window_bytes(self._fb, box))
+    
+    def _window_box(self, region: Region) -> Tuple[int, int, int, int]:
+        """Region bounds widened to whole bytes horizontally (8 px per byte)."""
+        x0 = region.x // 8 * 8
+        x1 = min(DISPLAY_WIDTH, (region.x + region.width + 7) // 8 * 8)
+        return (x0, region.y, x1, min(DISPLAY_HEIGHT, region.y + region.height))
+    
+    def push_busy(self) -> bool:
+        """True while a push (full or partial refresh) is still running on the push thread."""
+        return self._push_thread is not None and self._push_thread.is_alive()
+    
+    def _wait_for_push(self):
+        """Block until any in-flight push, full or partial, has finished."""
+        if self._push_thread:
+            self._push_thread.join()
+            self._push_thread = None
+    
+    def _push_full(self, buf: bytearray, label: str):
+        """Send a full frame and refresh the panel (runs on the push thread)."""
+        try:
+            self.epd.set_frame_window()
+            self.epd.display(buf)
+            log.info("Full refresh complete" + label)
+        except Exception as e:
+            log.error(f"Full refresh failed: {e}")
+            self._panel_stale = True
+    
+    def _push_partial(self, *region_names: str) -> bool:
+        """
+        Partial refresh that only sends the given regions over SPI.
+        Each region is written into controller RAM through its own window,
+        then a single partial update is triggered for all of them. Packing and
+        diffing happen here; the transfer runs on the push thread.
+        Returns False if nothing had changed on the panel and no refresh ran.
+        """
+        frame_hash = self._frame_hash()
+        if frame_hash == self._last_img_hash:
+            log.debug(f"Partial refresh skipped: unchanged ({', '.join(region_names)})")
+            return False  # Redrawn to identical pixels - nothing to send
+        
+        self._wait_for_push()
+        if self._partial_windows and self._partial_primed:
+            windows = []
+            for name in region_names:
+                box = self._window_box(REGIONS[name])
+                data = self._pack_frame(box)
+                old = self._window_bytes(self._shadow, box) if self._shadow is not None else None
+                if old is not None:
+                    diff = self._diff_window(old, data, box)
+                    if diff is None:
+                        continue  # This window is already on the panel
+                    flipped, box, data = diff
+                    self._erased_pixels += flipped
+                self._store_shadow_window(box, data)
+                windows.append((box, data))
+            self._last_img_hash = frame_hash
+            if not windows:
+                log.debug(f"Partial refresh skipped: unchanged ({', '.join(region_names)})")
+                return False
+            target, args = self._push_windows, (windows,)
+        else:
+            # Note: Partial refresh support depends on the specific display model
+            # The 4.26" supports partial refresh via init_part() method
+            buf = self._pack_frame()
+            if self._supports_partial:
+                self._partial_primed = True
+            frame = bytearray(self._fb)
+            if self._shadow is not None:
+                self._erased_pixels += self._flipped_pixels(self._shadow, frame)
+            self._shadow = frame
+            self._last_img_hash = frame_hash
+            target, args = self._push_partial_frame, (buf,)
+        
+        self._push_thread = Thread(target=target, name='epd-push', daemon=True, args=args)
+        self._push_thread.start()
+        return True
+    
+    def _push_windows(self, windows: List[Tuple[Tuple[int, int, int, int], bytes]]):
+        """Write windows into controller RAM, then one partial update (runs on the push thread)."""
+        try:
+            for box, data in windows:
+                self.epd.write_window(box, data)
+            # display() and Clear() write whole frames from the current cursor
+            self.epd.set_frame_window()
+            self.epd.TurnOnDisplay_Part()
+        except Exception as e:
+            log.error(f"Partial refresh failed: {e}")
+            self._panel_stale = True
+    
+    def _push_partial_frame(self, buf: bytearray):
+        """Send a whole frame as a partial refresh (runs on the push thread)."""
+        try:
+            self.epd.set_frame_window()
+            if self._supports_partial:
+                self.epd.display_Partial(buf)
+            else:
+                # Fallback to full refresh if partial not available
+                self.epd.display(buf)
+        except Exception as e:
+            log.error(f"Partial refresh failed: {e}")
+            self._panel_stale = True
+    
+    def _diff_window(self, old: bytes, new: bytes, box: Tuple[int, int, int, int]
+                     ) -> Optional[Tuple[int, Tuple[int, int, int, int], bytes]]:
+        """
+        Diff a packed window against the shadow in one XOR pass. Returns None if
+        unchanged, else (pixels flipped, tightest byte-aligned box that changed,
+        that box's packed bytes) - so only the changed rows/bytes go over SPI.
+        """
+        if old == new:
+            return None
+        if not NUMPY_AVAILABLE:
+            return self._flipped_pixels(old, new), box, new
+        x0, y0, x1, y1 = box
+        cur = np.frombuffer(new, dtype=np.uint8).reshape(y1 - y0, (x1 - x0) // 8)
+        diff = cur ^ np.frombuffer(old, dtype=np.uint8).reshape(cur.shape)
+        rows = np.flatnonzero(diff.any(axis=1))
+        cols = np.flatnonzero(diff.any(axis=0))
+        r0, r1 = int(rows[0]), int(rows[-1]) + 1
+        c0, c1 = int(cols[0]), int(cols[-1]) + 1
+        flipped = int(np.unpackbits(diff[r0:r1, c0:c1]).sum())
+        changed = (x0 + c0 * 8, y0 + r0, x0 + c1 * 8, y0 + r1)
+        return flipped, changed, cur[r0:r1, c0:c1].tobytes()
+    
+    @staticmethod
+    def _flipped_pixels(old: bytes, new: bytes) -> int:
+        """Number of pixels that differ between two packed 1-bit buffers."""
+        if NUMPY_AVAILABLE:
+            diff = np.bitwise_xor(np.frombuffer(old, dtype=np.uint8), np.frombuffer(new, dtype=np.uint8))
+            return int(np.unpackbits(diff).sum())
+        return bin(int.from_bytes(old, 'big') ^ int.from_bytes(new, 'big')).count('1')
+    
+    @staticmethod
+    def _window_bytes(frame: bytearray, box: Tuple[int, int, int, int]) -> bytes:
+        """The rows of a packed full frame that fall in a byte-aligned box."""
+        x0, y0, x1, y1 = box
+        stride = DISPLAY_WIDTH // 8
+        b0, b1 = x0 // 8, x1 // 8
+        return b''.join(frame[y * stride + b0:y * stride + b1] for y in range(y0, y1))
+    
+    def _store_shadow_window(self, box: Tuple[int, int, int, int], data: bytes):
+        """Record a window just written to controller RAM."""
+        if self._shadow is None:
+            return
+        x0, y0, x1, y1 = box
+        stride = DISPLAY_WIDTH // 8
+        b0, b1 = x0 // 8, x1 // 8
+        row = b1 - b0
+        for i, y in enumerate(range(y0, y1)):
+            self._shadow[y * stride + b0:y * stride + b1] = data[i * row:(i + 1) * row]
+    
+    def _frame_hash(self) -> int:
+        """Pack the frame into the framebuffer and fingerprint it (48 KB, ~tens of µs)."""
+        self._sync_framebuffer()
+        return hash(bytes(self._fb))
+    
+    def _save_preview(self) -> bool:
+        """Simulation mode: write the frame to epaper_preview.png if it changed."""
+        frame_hash = self._frame_hash()
+        if frame_hash == self._last_img_hash:
+            return False
+        self.image.save('epaper_preview.png')
+        self._last_img_hash = frame_hash
+        return True
+    
+    def _clear_region(self, region: Region):
+        """
+        Fill a region with white.
+        paste() with a colour is a C fill over exactly the region - unlike
+        draw.rectangle(), whose inclusive end coordinates spill one row and
+        column into the neighbouring region.
+        """
+        self.image.paste(255, region.bounds)
+    
     def clear(self):
         """Clear the entire display."""
         if self.draw:
-            self.draw.rectangle([0, 0, DISPLAY_WIDTH, DISPLAY_HEIGHT], fill=255)
+            self._clear_region(REGIONS['full'])
         if self.epd:
+            self._wait_for_push()
+            self.epd.set_frame_window()
             self.epd.Clear()
-        self.last_full_refresh = time.time()
+            self._partial_primed = False
+            self._last_img_hash = None
+            self._shadow = bytearray(b'\xff' * (DISPLAY_WIDTH // 8 * DISPLAY_HEIGHT))
+            self._erased_pixels = 0
+        self.last_full_refresh = time.monotonic()
         log.info("Display cleared")
     
+    def probe_windows(self):
+        """
+        --probe-windows: check windowed RAM writes on the panel itself. A full
+        refresh outlines three regions (one on the top rows, where a Y-decrementing
+        mode wraps), then one windowed partial fills them. If every fill sits
+        inside its outline, EPD_PARTIAL_WINDOWS=1 is safe on this panel.
+        """
+        if not (self.epd and self.draw and self._supports_partial and
+                self.epd.windows_addressable and hasattr(self.epd, 'TurnOnDisplay_Part')):
+            log.error("This driver can't do windowed writes - nothing to probe")
+            return
+        boxes = [self._window_box(REGIONS[name]) for name in ('weather', 'clock', 'flight')]
+        
+        self._clear_region(REGIONS['full'])
+        for x0, y0, x1, y1 in boxes:
+            self.draw.rectangle((x0, y0, x1 - 1, y1 - 1), outline=0)
+        self._sync_framebuffer()
+        buf = self._pack_frame()
+        self.epd.set_frame_window()
+        self.epd.display(buf)
+        self.epd.display_Partial(buf)  # Switch the panel into partial mode
+        
+        for x0, y0, x1, y1 in boxes:
+            self.image.paste(0, (x0 + 8, y0 + 4, x1 - 8, y1 - 4))
+        self._sync_framebuffer()
+        self._push_windows([(box, self._window_bytes(self._fb, box)) for box in boxes])
+        if self._panel_stale:
+            return
+        log.info("Probe drawn: if each black fill sits inside its outline, "
+                 "run with EPD_PARTIAL_WINDOWS=1")
+    
     def _draw_clock(self, now: datetime):
         """Draw the main clock."""
         region = REGIONS['clock']
         
         # Clear region
-        self.draw.rectangle(region.bounds, fill=255)
+        self._clear_region(region)
         
         # Draw time
         time_str = now.strftime('%H:%M')
-        font = self.fonts.get(120)
+        glyphs = self.clock_glyphs
         
         # Center the text
-        bbox = self.draw.textbbox((0, 0), time_str, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
+        text_width = int(sum(glyphs[ch][1] for ch in time_str))
+        top = min(self._clock_extents[ch][0] for ch in time_str)
+        bottom = max(self._clock_extents[ch][1] for ch in time_str)
         
         x = region.x + (region.width - text_width) // 2
-        y = region.y + (region.height - text_height) // 2
-        
-        self.draw.text((x, y), time_str, font=font, fill=0)
+        y = region.y + (region.height - (bottom - top)) // 2
+        
+        # Ink each digit through its mask - a C blit per character
+        pen = 0.0
+        for ch in time_str:
+            mask, advance = glyphs[ch]
+            self.image.paste(0, (x + int(pen), y), mask)
+            pen += advance
     
     def _draw_date(self, now: datetime):
         """Draw the date below the clock."""
         region = REGIONS['date']
         
         # Clear region
-        self.draw.rectangle(region.bounds, fill=255)
+        self._clear_region(region)
         
         # Draw date
         date_str = now.strftime('%A, %d %B')
         font = self.fonts.get(24)
-        
-        bbox = self.draw.textbbox((0, 0), date_str, font=font)
-        text_width = bbox[2] - bbox[0]
+        text_width = self.fonts.text_width(date_str, 24)
         
         x = region.x + (region.width - text_width) // 2
         y = region.y + 5
@@ -552,7 +1343,7 @@ class DisplayRenderer:
         region = REGIONS['weather']
         
         # Clear region
-        self.draw.rectangle(region.bounds, fill=255)
+        self._clear_region(region)
         
         if not weather or 'temp' not in weather:
             return
@@ -578,15 +1369,25 @@ class DisplayRenderer:
         """Draw flight information."""
         region = REGIONS['flight']
         
-        # Clear region
-        self.draw.rectangle(region.bounds, fill=255)
-        
         if not flight:
-            # Draw "No aircraft nearby" or leave empty
-            font = self.fonts.get(20)
-            self.draw.text((10, region.y + 40), "✈ Scanning for aircraft...", font=font, fill=0)
+            # "No aircraft nearby" never changes - render it once, then paste
+            template = self._templates.get('no_flight')
+            if template is None:
+                self._clear_region(region)
+                font = self.fonts.get(20)
+                text = "✈ Scanning for aircraft..."
+                # Lifted if a fallback font's ink would run past the region,
+                # so the cropped template holds every pixel drawn
+                y = min(region.y + 40, region.y + region.height - font.getbbox(text, mode='1')[3])
+                self.draw.text((10, y), text, font=font, fill=0)
+                self._templates['no_flight'] = self.image.crop(region.bounds)
+            else:
+                self.image.paste(template, region.bounds[:2])
             return
         
+        # Clear region
+        self._clear_region(region)
+        
         font_large = self.fonts.get(28)
         font_medium = self.fonts.get(22)
         font_small = self.fonts.get(18)
@@ -623,7 +1424,7 @@ class DisplayRenderer:
         region = REGIONS['status']
         
         # Clear region
-        self.draw.rectangle(region.bounds, fill=255)
+        self._clear_region(region)
         
         font = self.fonts.get(16)
         
@@ -641,12 +1442,21 @@ class DisplayRenderer:
                 self.draw.text((region.x + 5, y), alert, font=font, fill=0)
                 y += 22
     
+    def _blit_art(self, art: Image.Image, x: int, y: int):
+        """
+        Paste dithered art into the frame buffer.
+        Same-mode ('1' onto '1') paste is a plain C row copy, so keep it that way.
+        """
+        if art.mode != '1':
+            art = art.convert('1', dither=Image.Dither.NONE)
+        self.image.paste(art, (x, y))
+    
     def _draw_now_playing(self, now_playing: Optional[Dict]):
         """Draw Spotify now playing info with optional album art thumbnail."""
         region = REGIONS['now_playing']
         
         # Clear region
-        self.draw.rectangle(region.bounds, fill=255)
+        self._clear_region(region)
         
         if not now_playing or not now_playing.get('playing'):
             return
@@ -672,7 +1482,7 @@ class DisplayRenderer:
                 if dithered:
                     # Center vertically in region
                     art_y = region.y + (region.height - art_size) // 2
-                    self.image.paste(dithered, (art_x, art_y))
+                    self._blit_art(dithered, art_x, art_y)
                     art_width = art_size + 15  # Add padding after art
                     log.info(f"Album art rendered at ({art_x}, {art_y})")
                 else:
@@ -719,7 +1529,7 @@ class DisplayRenderer:
         # Draw large centered album art
         art_x = (DISPLAY_WIDTH - art_size) // 2
         art_y = region.y + 10
-        self.image.paste(dithered, (art_x, art_y))
+        self._blit_art(dithered, art_x, art_y)
         
         # Draw track and artist info below art
         artist = now_playing.get('artist', '')
@@ -732,16 +1542,14 @@ class DisplayRenderer:
         font_track = self.fonts.get(24)
         if len(track) > 35:
             track = track[:32] + "..."
-        bbox = self.draw.textbbox((0, 0), track, font=font_track)
-        text_width = bbox[2] - bbox[0]
+        text_width = self.fonts.text_width(track, 24)
         self.draw.text(((DISPLAY_WIDTH - text_width) // 2, info_y), track, font=font_track, fill=0)
         
         # Artist name
         font_artist = self.fonts.get(18)
         if len(artist) > 40:
             artist = artist[:37] + "..."
-        bbox = self.draw.textbbox((0, 0), artist, font=font_artist)
-        text_width = bbox[2] - bbox[0]
+        text_width = self.fonts.text_width(artist, 18)
         self.draw.text(((DISPLAY_WIDTH - text_width) // 2, info_y + 30), artist, font=font_artist, fill=0)
         
         # Draw mini clock in corner
@@ -753,15 +1561,16 @@ class DisplayRenderer:
         return True
     
     def render_full(self, weather: Optional[Dict], flight: Optional[Dict], 
-                    special_alerts: Dict = None, now_playing: Optional[Dict] = None):
-        """Perform a full display render and refresh."""
+                    special_alerts: Dict = None, now_playing: Optional[Dict] = None,
+                    now: Optional[datetime] = None):
+        """Perform a full display render and refresh (at `now`, default the current time)."""
         if not self.draw:
             return
         
-        now = datetime.now()
+        now = now or datetime.now()
         
         # Clear entire display
-        self.draw.rectangle([0, 0, DISPLAY_WIDTH, DISPLAY_HEIGHT], fill=255)
+        self._clear_region(REGIONS['full'])
         
         # Check for music mode
         music_mode_rendered = False
@@ -786,79 +1595,109 @@ class DisplayRenderer:
             self._draw_now_playing(now_playing)
             self.music_mode_active = False
         
-        # Push to display
+        # Push to display in the background - the next frame can be composed
+        # while the panel is still refreshing
         if self.epd:
-            self.epd.display(self.epd.getbuffer(self.image))
-            self.last_full_refresh = time.time()
-            log.info("Full refresh complete" + (" (music mode)" if music_mode_rendered else ""))
+            self._last_img_hash = self._frame_hash()
+            buf = self._pack_frame()
+            self._wait_for_push()
+            self._partial_primed = False
+            self._panel_stale = False
+            self._shadow = bytearray(self._fb)
+            self._erased_pixels = 0
+            self.last_full_refresh = time.monotonic()
+            self._push_thread = Thread(
+                target=self._push_full, name='epd-push', daemon=True,
+                args=(buf, " (music mode)" if music_mode_rendered else ""))
+            self._push_thread.start()
         else:
             # Simulation mode - save to file
-            self.image.save('epaper_preview.png')
-            log.info("Preview saved to epaper_preview.png" + (" (music mode)" if music_mode_rendered else ""))
+            if self._save_preview():
+                log.info("Preview saved to epaper_preview.png" + (" (music mode)" if music_mode_rendered else ""))
         
-        self.current_minute = now.minute
+        self._clock_state = (now.hour, now.minute)
+        self._date_state = now.date()
         self.current_flight = flight
+        self._content_state = self._state_key(flight, special_alerts, now_playing)
+    
+    @staticmethod
+    def _state_key(flight: Optional[Dict], special_alerts: Optional[Dict],
+                   now_playing: Optional[Dict]) -> Tuple:
+        """Fingerprint of what the flight, status and now-playing areas show."""
+        flight_id = None
+        if flight:
+            # Exactly the values _draw_flight renders: position noise below the
+            # displayed precision (0.1 km, whole flight levels) doesn't count
+            altitude = flight.get('altitude')
+            flight_id = (flight.get('callsign', flight.get('icao24')), flight.get('distance'),
+                         flight.get('typecode'), flight.get('registration'),
+                         int(altitude / 30.48) if altitude else None)
+        alert_counts = tuple(sorted((k, len(v or ())) for k, v in (special_alerts or {}).items()))
+        track_id = ((now_playing.get('artist'), now_playing.get('track'))
+                    if now_playing and now_playing.get('playing') else None)
+        return (flight_id, alert_counts, track_id)
     
-    def partial_update_clock(self):
-        """Update just the clock region."""
+    def partial_update_all(self, now: datetime, flight: Optional[Dict], special_alerts: Dict = None,
+                           now_playing: Optional[Dict] = None):
+        """
+        Redraw whatever changed this tick - the clock on a new minute, the
+        flight/status/now-playing strip when what it shows changed - and push
+        it all in a single partial refresh (one controller wake, not two).
+        """
         if not self.draw:
             return
         
-        now = datetime.now()
-        if now.minute == self.current_minute:
+        # Keyed on hour as well as minute, so a stall of exactly an hour still redraws
+        clock_changed = (now.hour, now.minute) != self._clock_state
+        date_changed = now.date() != self._date_state
+        state = self._state_key(flight, special_alerts, now_playing)
+        content_changed = state != self._content_state
+        if not (clock_changed or date_changed or content_changed):
             return  # No change needed
         
-        self._draw_clock(now)
-        self._draw_date(now)
+        regions = []
+        if clock_changed:
+            self._draw_clock(now)
+            regions.append('clock')
+        if date_changed:
+            self._draw_date(now)
+            regions.append('date')
+        if content_changed:
+            self._draw_flight(flight)
+            self._draw_status(special_alerts or {})
+            if not self.music_mode_active:
+                self._draw_now_playing(now_playing)
+            regions += ['flight', 'now_playing', 'status']
         
         if self.epd:
-            # Note: Partial refresh support depends on the specific display model
-            # The 4.26" supports partial refresh via init_part() method
-            try:
-                self.epd.display_Partial(self.epd.getbuffer(self.image))
+            pushed = self._push_partial(*regions)
+            if pushed and clock_changed:
                 log.info(f"Clock updated: {now.strftime('%H:%M')}")
-            except AttributeError:
-                # Fallback to full refresh if partial not available
-                self.epd.display(self.epd.getbuffer(self.image))
-        else:
-            self.image.save('epaper_preview.png')
-        
-        self.current_minute = now.minute
-    
-    def partial_update_flight(self, flight: Optional[Dict], special_alerts: Dict = None):
-        """Update just the flight region."""
-        if not self.draw:
-            return
-        
-        # Check if flight changed
-        new_callsign = flight.get('callsign') if flight else None
-        old_callsign = self.current_flight.get('callsign') if self.current_flight else None
-        
-        if new_callsign == old_callsign and not special_alerts:
-            return  # No change
-        
-        self._draw_flight(flight)
-        self._draw_status(special_alerts or {})
-        
-        if self.epd:
-            try:
-                self.epd.display_Partial(self.epd.getbuffer(self.image))
-                log.info(f"Flight updated: {new_callsign or 'None'}")
-            except AttributeError:
-                self.epd.display(self.epd.getbuffer(self.image))
+            if pushed and content_changed:
+                log.info(f"Flight updated: {(flight.get('callsign') if flight else None) or 'None'}")
         else:
-            self.image.save('epaper_preview.png')
-        
-        self.current_flight = flight
+            self._save_preview()
+        
+        if clock_changed:
+            self._clock_state = (now.hour, now.minute)
+        if date_changed:
+            self._date_state = now.date()
+        if content_changed:
+            self.current_flight = flight
+            self._content_state = state
     
     def needs_full_refresh(self) -> bool:
         """Check if a full refresh is needed (to prevent ghosting)."""
-        return time.time() - self.last_full_refresh > FULL_REFRESH_INTERVAL
+        return (time.monotonic() - self.last_full_refresh > FULL_REFRESH_INTERVAL or
+                self._erased_pixels > EINK_PARTIAL_ERASURE_LIMIT or
+                self._panel_stale)
     
     def cleanup(self):
         """Clean up display resources."""
         if self.epd:
             try:
+                self._wait_for_push()
+                self._save_refresh_stamp()
                 self.epd.sleep()
                 log.info("Display entered sleep mode")
             except Exception as e:
@@ -875,18 +1714,15 @@ class VectorClockDisplay:
     def __init__(self):
         self.fetcher = DataFetcher(SERVER_URL)
         self.renderer = DisplayRenderer()
-        self.running = Event()
-        self.running.set()
+        self.stop_event = Event()  # Set on shutdown; waits on it wake immediately
         
         # State
         self.weather = None
         self.flight = None
         self.special_alerts = {}
         self.now_playing = None
-        
-        # Timing
-        self.last_weather_update = 0
-        self.last_flight_check = 0
+        self._settings_pending: Optional[Future] = None  # Album art settings fetch still running
+        self._err_backoff = ERROR_BACKOFF_MIN
         
         # Signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -895,37 +1731,89 @@ class VectorClockDisplay:
     def _signal_handler(self, sig, frame):
         """Handle shutdown signals."""
         log.info("Shutdown signal received")
-        self.running.clear()
+        self.stop_event.set()
     
-    def _wait_for_minute(self):
-        """Wait until the start of the next minute."""
-        now = datetime.now()
-        seconds_to_wait = 60 - now.second
-        log.info(f"Waiting {seconds_to_wait}s for next minute...")
-        time.sleep(seconds_to_wait)
-    
-    def _update_weather(self):
-        """Update weather data if needed."""
-        now = time.time()
-        if now - self.last_weather_update >= WEATHER_UPDATE_INTERVAL:
-            self.weather = self.fetcher.get_weather()
-            self.last_weather_update = now
+    @staticmethod
+    def _next_minute_tick() -> float:
+        """Wall-clock timestamp of the next minute boundary."""
+        return ceil(time.time() / 60) * 60
+    
+    def _next_due(self, task: str) -> float:
+        """
+        Monotonic time a task should next run. The clock lands exactly on the
+        next wall-clock minute; polls repeat on their interval (monotonic, so
+        NTP steps don't stretch or skip them).
+        """
+        if task == 'clock':
+            # Aim just past the rollover: a wait that returns a hair early would
+            # otherwise land on the old minute and need a second pass
+            return time.monotonic() + max(0, self._next_minute_tick() - time.time()) + CLOCK_TICK_MARGIN
+        return time.monotonic() + TASK_INTERVALS[task]
+    
+    def _update_data(self, flights: bool, weather: bool, deadline: Optional[float] = None):
+        """
+        Fetch the requested groups (flights/alerts/now playing, weather) in one concurrent batch.
+        With a wall-clock `deadline`, stop waiting at it so a slow server can't hold up
+        the next tick; anything unfinished is picked up on a later pass.
+        """
+        if not (weather or flights or self.fetcher.pending or self._settings_pending):
+            return
+        
+        # The album art settings check rides along with the flight batch; one
+        # that misses the deadline stays pending (never doubled up) like the rest
+        album_art = self.renderer.album_art
+        if flights and self._settings_pending is None and album_art.settings_due():
+            self._settings_pending = self.fetcher.pool.submit(album_art.fetch_settings, SERVER_URL)
+        timeout = None if deadline is None else max(0, deadline - time.time())
+        results = self.fetcher.fetch_all(flights=flights, weather=weather, timeout=timeout)
+        if self._settings_pending:
+            wait([self._settings_pending], timeout=None if deadline is None else max(0, deadline - time.time()))
+            if self._settings_pending.done():
+                album_art.apply_settings(self._settings_pending.result())
+                self._settings_pending = None
+        
+        if 'weather' in results:
+            self.weather = results['weather']
             if self.weather:
                 log.info(f"Weather: {self.weather.get('temp')}°C, {self.weather.get('condition')}")
-    
-    def _update_flight(self):
-        """Update flight data if needed."""
-        now = time.time()
-        if now - self.last_flight_check >= FLIGHT_CHECK_INTERVAL:
-            self.flight = self.fetcher.get_flights()
-            self.special_alerts = self.fetcher.get_special_alerts()
-            self.now_playing = self.fetcher.get_now_playing()
-            self.last_flight_check = now
-            
+        if 'special_alerts' in results:
+            self.special_alerts = results['special_alerts']
+        if 'flight' in results:
+            self.flight = results['flight']
             if self.flight:
                 log.info(f"Flight: {self.flight.get('callsign')} @ {self.flight.get('distance')}km")
+        if 'now_playing' in results:
+            self.now_playing = results['now_playing']
             if self.now_playing:
                 log.info(f"Now Playing: {self.now_playing.get('artist')} - {self.now_playing.get('track')}")
+        if self.fetcher.pending:
+            log.debug(f"Still fetching: {', '.join(self.fetcher.pending)}")
+    
+    def _run_tasks(self, due: set) -> bool:
+        """
+        Run every task that came due together: one fetch batch, then one display update.
+        Returns True if the display update was deferred because a push (full or partial) is still running.
+        """
+        # Don't let slow fetches run over the next minute; a tick with nothing
+        # to fetch (clock, display retry) only collects what already finished
+        fetching = bool(due & {'flights', 'weather'})
+        self._update_data(flights='flights' in due, weather='weather' in due,
+                          deadline=self._next_minute_tick() if fetching else time.time())
+        
+        # One wall-clock snapshot per tick for everything drawn from it
+        now = datetime.now()
+        
+        # Check if full refresh needed (anti-ghosting)
+        if self.renderer.needs_full_refresh():
+            log.info("Performing anti-ghosting full refresh")
+            self.renderer.render_full(self.weather, self.flight, self.special_alerts, self.now_playing, now)
+        elif self.renderer.push_busy():
+            # A push (full or partial) is still on the panel - don't block, try again shortly
+            return True
+        else:
+            # Partial update (clock and flight strip coalesced into one refresh)
+            self.renderer.partial_update_all(now, self.flight, self.special_alerts, self.now_playing)
+        return False
     
     def run(self):
         """Main run loop."""
@@ -935,56 +1823,47 @@ class VectorClockDisplay:
         log.info(f"Display: {DISPLAY_WIDTH}x{DISPLAY_HEIGHT}")
         log.info("=" * 60)
         
-        # Fetch album art display settings
-        self.renderer.album_art.fetch_settings(SERVER_URL)
-        
-        # Initial data fetch
+        # Initial data fetch, batched: album art settings, weather and now playing
+        # go out alongside the location lookup (flights and alerts need the location)
+        self._settings_pending = self.fetcher.pool.submit(self.renderer.album_art.fetch_settings, SERVER_URL)
+        self.fetcher.prefetch('weather', 'now_playing')
         self.fetcher.get_location()
-        self._update_weather()
-        self._update_flight()
+        self._update_data(flights=True, weather=True)
         
         # Initial full render
         self.renderer.render_full(self.weather, self.flight, self.special_alerts, self.now_playing)
         
-        # Wait for the next minute boundary for synchronization
-        self._wait_for_minute()
+        # One min-heap of (due, task) drives everything; the clock task also
+        # syncs the loop to the next minute boundary
+        schedule = [(self._next_due(task), task) for task in TASK_INTERVALS]
+        heapq.heapify(schedule)
         
         # Main loop
-        while self.running.is_set():
+        while not self.stop_event.is_set():
+            if self.stop_event.wait(max(0, schedule[0][0] - time.monotonic())):
+                break
+            
+            # Pop everything due now, so coinciding tasks share a fetch batch and a refresh
+            due = set()
+            now = time.monotonic()
+            while schedule and schedule[0][0] <= now:
+                due.add(heapq.heappop(schedule)[1])
+            for task in due & TASK_INTERVALS.keys():
+                heapq.heappush(schedule, (self._next_due(task), task))
+            
             try:
-                loop_start = time.time()
-                
-                # Update data
-                self._update_weather()
-                self._update_flight()
-                
-                # Check if full refresh needed (anti-ghosting)
-                if self.renderer.needs_full_refresh():
-                    log.info("Performing anti-ghosting full refresh")
-                    self.renderer.render_full(self.weather, self.flight, self.special_alerts, self.now_playing)
-                else:
-                    # Partial updates
-                    self.renderer.partial_update_clock()
-                    self.renderer.partial_update_flight(self.flight, self.special_alerts)
-                
-                # Calculate sleep time to hit next minute boundary
-                now = datetime.now()
-                seconds_to_next_minute = 60 - now.second
-                
-                # But also check for flights more frequently
-                sleep_time = min(seconds_to_next_minute, FLIGHT_CHECK_INTERVAL)
-                
-                # Account for loop execution time
-                elapsed = time.time() - loop_start
-                sleep_time = max(1, sleep_time - elapsed)
-                
-                time.sleep(sleep_time)
-                
+                if self._run_tasks(due):
+                    # One-shot retry for the deferred display update
+                    heapq.heappush(schedule, (time.monotonic() + PUSH_RETRY_DELAY, 'display'))
+                self._err_backoff = ERROR_BACKOFF_MIN
             except Exception as e:
-                log.error(f"Loop error: {e}")
-                time.sleep(5)
+                log.error(f"Loop error: {e} (retrying in {self._err_backoff}s)")
+                if self.stop_event.wait(self._err_backoff + random.uniform(-0.2, 0.2)):
+                    break
+                self._err_backoff = min(ERROR_BACKOFF_MAX, self._err_backoff * 2)
         
         # Cleanup
+        self.fetcher.pool.shutdown(wait=False, cancel_futures=True)
         self.renderer.cleanup()
         log.info("VectorClock Display stopped")
 
@@ -993,9 +1872,8 @@ class VectorClockDisplay:
 # Entry Point
 # ═══════════════════════════════════════════════════════════════
 
-def main():
-    """Entry point."""
-    print("""
+# Startup banner (only shown on an interactive terminal, not in the journal)
+BANNER = """
 ╔═══════════════════════════════════════════════════════════╗
 ║                                                           ║
 ║   ██╗   ██╗███████╗ ██████╗████████╗ ██████╗ ██████╗     ║
@@ -1009,7 +1887,13 @@ def main():
 ║        Waveshare 4.26" HAT (800x480)                      ║
 ║                                                           ║
 ╚═══════════════════════════════════════════════════════════╝
-    """)
+"""
+
+
+def main():
+    """Entry point."""
+    if sys.stdout.isatty():
+        sys.stdout.write(BANNER + "\n")
     
     if not PIL_AVAILABLE:
         print("ERROR: PIL/Pillow is required. Install with: pip3 install Pillow")
@@ -1024,6 +1908,12 @@ def main():
         print("         Preview will be saved to epaper_preview.png")
         print("")
     
+    if '--probe-windows' in sys.argv[1:]:
+        renderer = DisplayRenderer()
+        renderer.probe_windows()
+        renderer.cleanup()
+        return
+    
     app = VectorClockDisplay()
     app.run()
 
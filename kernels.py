@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+VectorClock numeric kernels
+
+The e-paper driver's (epaper-display.py) hot loops, JIT-compiled with numba
+when it is installed and run as plain Python - or whole-array numpy - otherwise.
+
+Only numeric primitives here: arrays and scalars in, arrays and scalars out,
+no Python objects, so every kernel stays compilable in numba's nopython mode.
+Bookkeeping (HTTP, dicts, Pillow images) stays in the driver.
+"""
+
+import os
+from math import pi, cos, sin, sqrt, atan2
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Compiled kernels are cached with the rest of the driver's on-disk cache, so
+# restarts skip the ~30 s Pi Zero compile (this directory may not be writable)
+os.environ.setdefault('NUMBA_CACHE_DIR', os.path.join(
+    os.environ.get('VECTORCLOCK_CACHE_DIR', os.path.expanduser('~/.cache/vectorclock')), 'numba'))
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+EARTH_RADIUS_KM = 6371
+DEG_TO_RAD = pi / 180
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Calculate distance between two points in km."""
+    lat1 *= DEG_TO_RAD
+    lat2 *= DEG_TO_RAD
+    dlat = lat2 - lat1
+    dlon = (lon2 - lon1) * DEG_TO_RAD
+
+    a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
+    c = 2 * atan2(sqrt(a), sqrt(1 - a))
+
+    return EARTH_RADIUS_KM * c
+
+
+def closest_index(lats, lons, lat0: float, lon0: float):
+    """
+    Index of, and haversine distance (km) to, the point nearest (lat0, lon0).
+    Same arithmetic as haversine(), as one loop over float64 arrays.
+    """
+    best_idx = -1
+    best_dist = float('inf')
+    phi0 = lat0 * DEG_TO_RAD
+    cos_phi0 = cos(phi0)
+    for i in range(lats.shape[0]):
+        phi = lats[i] * DEG_TO_RAD
+        dlat = phi - phi0
+        dlon = (lons[i] - lon0) * DEG_TO_RAD
+        a = sin(dlat / 2) ** 2 + cos_phi0 * cos(phi) * sin(dlon / 2) ** 2
+        dist = EARTH_RADIUS_KM * 2 * atan2(sqrt(a), sqrt(1 - a))
+        if dist < best_dist:
+            best_dist = dist
+            best_idx = i
+    return best_idx, best_dist
+
+
+def closest_index_vectorized(lats, lons, lat0: float, lon0: float):
+    """closest_index as whole-array numpy expressions, for when numba isn't installed."""
+    phi0 = lat0 * DEG_TO_RAD
+    phi = lats * DEG_TO_RAD
+    a = np.sin((phi - phi0) / 2) ** 2 + cos(phi0) * np.cos(phi) * np.sin((lons - lon0) * DEG_TO_RAD / 2) ** 2
+    dists = EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    idx = int(dists.argmin())
+    return idx, float(dists[idx])
+
+
+def atkinson_kernel(buf):
+    """
+    Atkinson error diffusion over an int16 grayscale array.
+    Mutates buf in place, leaving only 0/255 values.
+    """
+    height, width = buf.shape
+    for y in range(height):
+        for x in range(width):
+            old_pixel = buf[y, x]
+            new_pixel = 255 if old_pixel > 127 else 0
+            buf[y, x] = new_pixel
+            error = (old_pixel - new_pixel) >> 3  # Only 6/8 distributed
+
+            if x + 1 < width:
+                buf[y, x + 1] = max(0, min(255, buf[y, x + 1] + error))
+            if x + 2 < width:
+                buf[y, x + 2] = max(0, min(255, buf[y, x + 2] + error))
+            if y + 1 < height:
+                if x > 0:
+                    buf[y + 1, x - 1] = max(0, min(255, buf[y + 1, x - 1] + error))
+                buf[y + 1, x] = max(0, min(255, buf[y + 1, x] + error))
+                if x + 1 < width:
+                    buf[y + 1, x + 1] = max(0, min(255, buf[y + 1, x + 1] + error))
+            if y + 2 < height:
+                buf[y + 2, x] = max(0, min(255, buf[y + 2, x] + error))
+
+
+if NUMBA_AVAILABLE:
+    # Explicit signatures compile (or load from cache) at import, not on first use
+    atkinson_kernel = njit('void(int16[:, ::1])', cache=True, fastmath=True)(atkinson_kernel)
+    closest_index = njit('Tuple((int64, float64))(float64[::1], float64[::1], float64, float64)',
+                         cache=True)(closest_index)
+elif NUMPY_AVAILABLE:
+    closest_index = closest_index_vectorized
@@ -877,6 +877,7 @@ app.get('/api/config/spotify-display', (req, res) => {
     res.json({
         displayMode: userConfig.spotifyDisplayMode || 'thumbnail',  // 'thumbnail' or 'music'
         ditherAlgorithm: userConfig.spotifyDitherAlgorithm || 'floyd',  // 'floyd', 'atkinson', 'ordered'
+        bayerSize: userConfig.spotifyBayerSize || 8,  // ordered dither matrix: 4, 8 or 16
         showAlbumArt: userConfig.spotifyShowAlbumArt !== false,  // default true
         hideFlightsInMusicMode: userConfig.spotifyHideFlightsInMusicMode === true  // default false (show flights)
     });
@@ -884,7 +885,7 @@ app.get('/api/config/spotify-display', (req, res) => {
 
 // Update Spotify display settings
 app.post('/api/config/spotify-display', (req, res) => {
-    const { displayMode, ditherAlgorithm, showAlbumArt, hideFlightsInMusicMode } = req.body;
+    const { displayMode, ditherAlgorithm, bayerSize, showAlbumArt, hideFlightsInMusicMode } = req.body;
 
     if (displayMode && ['thumbnail', 'music'].includes(displayMode)) {
         userConfig.spotifyDisplayMode = displayMode;
@@ -892,6 +893,9 @@ app.post('/api/config/spotify-display', (req, res) => {
     if (ditherAlgorithm && ['floyd', 'atkinson', 'ordered'].includes(ditherAlgorithm)) {
         userConfig.spotifyDitherAlgorithm = ditherAlgorithm;
     }
+    if ([4, 8, 16].includes(bayerSize)) {
+        userConfig.spotifyBayerSize = bayerSize;
+    }
     if (typeof showAlbumArt === 'boolean') {
         userConfig.spotifyShowAlbumArt = showAlbumArt;
     }
@@ -907,6 +911,7 @@ app.post('/api/config/spotify-display', (req, res) => {
         success: true,
         displayMode: userConfig.spotifyDisplayMode || 'thumbnail',
         ditherAlgorithm: userConfig.spotifyDitherAlgorithm || 'floyd',
+        bayerSize: userConfig.spotifyBayerSize || 8,
         showAlbumArt: userConfig.spotifyShowAlbumArt !== false,
         hideFlightsInMusicMode: userConfig.spotifyHideFlightsInMusicMode === true
     });